@@ -4,8 +4,11 @@ Built-in extractors and plugin discovery via entry points.
 Plugins register under 'uridx.extractors' entry point group.
 """
 
+import json
+import os
 import sys
-from importlib.metadata import entry_points
+from importlib.metadata import EntryPoint, entry_points
+from pathlib import Path
 
 import typer
 
@@ -21,14 +24,55 @@ app.command("image")(image.extract)
 app.command("tsugite")(tsugite.extract)
 
 
-def load_plugins():
-    """Load extractor plugins from entry points."""
+PLUGIN_GROUP = "uridx.extractors"
+
+
+def _plugin_cache_path() -> Path:
+    return Path(os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache") / "uridx" / "plugins.json"
+
+
+def _sys_path_fingerprint() -> list[list]:
+    """mtimes of the sys.path entries; (un)installing a distribution touches its site-packages dir."""
+    fingerprint = []
+    for entry in sys.path:
+        try:
+            fingerprint.append([entry, os.stat(entry or ".").st_mtime_ns])
+        except OSError:
+            continue
+    return fingerprint
+
+
+def _discover_plugins() -> list[EntryPoint]:
+    """Entry points in the plugin group, cached on disk so CLI startup skips the metadata scan.
+
+    Scanning every installed distribution is the slow part; the cache is keyed by the
+    sys.path fingerprint and rebuilt whenever it changes.
+    """
+    cache = _plugin_cache_path()
+    fingerprint = _sys_path_fingerprint()
+    try:
+        cached = json.loads(cache.read_text())
+        if cached["fingerprint"] == fingerprint:
+            return [EntryPoint(name, value, PLUGIN_GROUP) for name, value in cached["plugins"]]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
     try:
-        eps = entry_points(group="uridx.extractors")
+        eps = list(entry_points(group=PLUGIN_GROUP))
     except TypeError:
-        eps = entry_points().get("uridx.extractors", [])
+        eps = list(entry_points().get(PLUGIN_GROUP, []))
+
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        cache.write_text(json.dumps({"fingerprint": fingerprint, "plugins": [[ep.name, ep.value] for ep in eps]}))
+    except OSError:
+        pass
+    return eps
+
 
-    for ep in eps:
+def load_plugins():
+    """Load extractor plugins from entry points."""
+    for ep in _discover_plugins():
         try:
             extractor = ep.load()
             if isinstance(extractor, typer.Typer):
@@ -1,11 +1,25 @@
 """Shared utilities for extractors."""
 
+import os
 import sys
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
+from typing import TypeVar
+
+from pydantic import TypeAdapter
 
 from uridx.record import Record
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+DEFAULT_JOBS = os.cpu_count() or 1
+
+_record_json = TypeAdapter(Record)
+
 
 class MissingExtractorDependency(Exception):
     """Raised by an extractor when an optional dependency or service is unavailable.
@@ -28,8 +42,40 @@ def get_file_mtime(path: Path) -> str:
 
 
 def output(record: Record) -> None:
-    """Print a record as one JSONL line (omitting unset/None fields)."""
-    print(record.model_dump_json(exclude_none=True))
+    """Write a record as one JSONL line (omitting unset/None fields).
+
+    Serializes straight to bytes on the binary stdout, skipping the str encode. That
+    buffer isn't line-buffered, so on a terminal each record is flushed as print would.
+    """
+    sys.stdout.buffer.write(_record_json.dump_json(record, exclude_none=True) + b"\n")
+    if sys.stdout.isatty():
+        sys.stdout.flush()
+
+
+def iter_files(root: Path, extensions: set[str] | None = None) -> Iterator[Path]:
+    """Recursively yield files under root, optionally only those with a (lowercased) suffix in extensions.
+
+    Uses os.scandir so entries are filtered on the raw name before a Path is built,
+    and file/dir checks reuse the d_type from readdir instead of a stat() each.
+    Symlinked directories are not followed (same as Path.rglob).
+    """
+    stack = [os.fspath(root)]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file():
+                    if extensions is not None:
+                        name = entry.name
+                        dot = name.rfind(".")
+                        if dot <= 0 or name[dot:].lower() not in extensions:
+                            continue
+                    yield Path(entry.path)
 
 
 def resolve_paths(paths: list[Path], extensions: set[str]) -> list[Path]:
@@ -42,7 +88,7 @@ def resolve_paths(paths: list[Path], extensions: set[str]) -> list[Path]:
         if p.is_file():
             files.append(p)
         elif p.is_dir():
-            files.extend(f for f in p.rglob("*") if f.suffix.lower() in extensions and f.is_file())
+            files.extend(iter_files(p, extensions))
     return files
 
 
@@ -69,3 +115,26 @@ def filter_existing_files(files: list[Path], force: bool) -> list[Path]:
 def prepare_files(paths: list[Path], extensions: set[str], force: bool) -> list[Path]:
     """Resolve paths to matching files, dropping already-ingested ones (unless force)."""
     return filter_existing_files(resolve_paths(paths, extensions), force)
+
+
+def _safe_call(fn: Callable[[T], R], item: T) -> R | None:
+    """fn(item), reporting an error and returning None instead of raising."""
+    try:
+        return fn(item)
+    except Exception as e:
+        print(f"Error processing {item}: {e}", file=sys.stderr)
+        return None
+
+
+def parallel_map(fn: Callable[[T], R], items: list[T], jobs: int = 1) -> Iterator[R | None]:
+    """Map fn over items, in a process pool when jobs > 1. Results keep input order.
+
+    fn must be a module-level (picklable) function. An item whose call raises is
+    reported on stderr and yields None, so one bad file doesn't abort the map.
+    """
+    call = partial(_safe_call, fn)
+    if jobs <= 1 or len(items) < 2:
+        yield from map(call, items)
+        return
+    with ProcessPoolExecutor(max_workers=min(jobs, len(items))) as pool:
+        yield from pool.map(call, items, chunksize=4)
@@ -2,6 +2,7 @@
 
 import json
 import sys
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Annotated, Optional
@@ -10,7 +11,12 @@ import typer
 
 from uridx.record import ChunkInput, Record
 
-from .base import filter_existing, output
+from .base import DEFAULT_JOBS, filter_existing, output, parallel_map
+
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # orjson is optional; stdlib json.loads also accepts bytes
+    from json import loads as _json_loads
 
 
 @dataclass
@@ -38,29 +44,29 @@ def _extract_content(message: dict) -> str:
     return ""
 
 
-def _is_tool_result(msg: dict) -> bool:
-    content = msg.get("message", {}).get("content", [])
+def _is_tool_result(message: dict) -> bool:
+    content = message.get("content")
     if isinstance(content, list) and content:
-        first = content[0] if content else {}
+        first = content[0]
         return isinstance(first, dict) and first.get("type") == "tool_result"
     return False
 
 
-def _build_turns(messages: list[dict]) -> list[ChunkInput]:
+def _build_turns(messages: Iterable[dict]) -> list[ChunkInput]:
     turns: list[ChunkInput] = []
     current_user = None
     current_assistant = []
 
     def _emit():
-        text_parts = []
+        parts = []
         if current_user:
-            text_parts.append(f"User: {current_user}")
+            parts += ("User: ", current_user)
         if current_assistant:
-            text_parts.append(f"Assistant: {' '.join(current_assistant)}")
-        if text_parts:
+            parts += ("\n\nAssistant: " if parts else "Assistant: ", " ".join(current_assistant))
+        if parts:
             turns.append(
                 ChunkInput(
-                    text="\n\n".join(text_parts),
+                    text="".join(parts),
                     key=f"turn-{len(turns)}",
                     meta={"turn_index": len(turns)},
                 )
@@ -71,11 +77,16 @@ def _build_turns(messages: list[dict]) -> list[ChunkInput]:
         if msg_type not in ("user", "assistant"):
             continue
 
-        content = _extract_content(msg.get("message", {}))
+        message = msg.get("message", {})
+        # Tool results arrive as user messages and are dropped; check before extracting text.
+        if msg_type == "user" and _is_tool_result(message):
+            continue
+
+        content = _extract_content(message)
         if not content:
             continue
 
-        if msg_type == "user" and not _is_tool_result(msg):
+        if msg_type == "user":
             if current_user or current_assistant:
                 _emit()
             current_user = content
@@ -90,19 +101,22 @@ def _build_turns(messages: list[dict]) -> list[ChunkInput]:
 
 
 def _parse_conversation(jsonl_path: Path) -> ParsedConversation | None:
-    messages = []
     metadata = {}
     first_timestamp = None
     last_timestamp = None
 
-    with open(jsonl_path, encoding="utf-8") as f:
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                msg = json.loads(line)
-                messages.append(msg)
+    def _messages() -> Iterator[dict]:
+        """Stream messages into _build_turns, recording timestamps/metadata on the way."""
+        nonlocal metadata, first_timestamp, last_timestamp
+        with open(jsonl_path, "rb") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    msg = _json_loads(line)
+                except json.JSONDecodeError:
+                    continue
                 if first_timestamp is None:
                     first_timestamp = msg.get("timestamp")
                 last_timestamp = msg.get("timestamp")
@@ -114,13 +128,9 @@ def _parse_conversation(jsonl_path: Path) -> ParsedConversation | None:
                         "git_branch": msg.get("gitBranch"),
                         "slug": msg.get("slug"),
                     }
-            except json.JSONDecodeError:
-                continue
-
-    if not messages:
-        return None
+                yield msg
 
-    chunks = _build_turns(messages)
+    chunks = _build_turns(_messages())
     if not chunks:
         return None
 
@@ -135,6 +145,7 @@ def extract(
     path: Annotated[Optional[Path], typer.Argument(help="Projects directory")] = None,
     force: Annotated[bool, typer.Option("--force", "-f", help="Re-process all files even if already ingested")] = False,
     tag: Annotated[Optional[list[str]], typer.Option("--tag", "-t", help="Additional tags")] = None,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="Parallel worker processes")] = DEFAULT_JOBS,
 ):
     """Extract Claude Code conversations from ~/.claude/projects/"""
     projects_dir = path or (Path.home() / ".claude" / "projects")
@@ -159,13 +170,8 @@ def extract(
     if not source_uri_map:
         return
 
-    for source_uri, (jsonl_file, project_hash) in source_uri_map.items():
-        try:
-            result = _parse_conversation(jsonl_file)
-        except Exception as e:
-            print(f"Error parsing {jsonl_file}: {e}", file=sys.stderr)
-            continue
-
+    files = [jsonl_file for jsonl_file, _ in source_uri_map.values()]
+    for source_uri, result in zip(source_uri_map, parallel_map(_parse_conversation, files, jobs)):
         if not result or not result.chunks:
             continue
 
@@ -176,6 +182,6 @@ def extract(
                 tags=["claude-code", "conversation"] + (tag or []),
                 title=result.title,
                 source_type="claude-code",
-                context=json.dumps(result.metadata),
+                context=result.metadata,
             )
         )
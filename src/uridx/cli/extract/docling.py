@@ -1,6 +1,5 @@
 """Extract documents using docling (PDF, DOCX, XLSX, PPTX, HTML, images)."""
 
-import json
 import sys
 from collections.abc import Iterator
 from pathlib import Path
@@ -124,6 +123,6 @@ def _build_record(
         tags=["document", *([ext] if ext else []), *extra_tags],
         title=title,
         source_type="document",
-        context=json.dumps({"source": source}),
+        context={"source": source},
         created_at=created_at,
     )
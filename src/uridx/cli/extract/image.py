@@ -5,10 +5,10 @@ import json
 import os
 import sys
 from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Annotated, Optional
 
-import httpx
 import typer
 
 from uridx.config import normalize_ollama_url
@@ -17,6 +17,8 @@ from uridx.record import Record
 from .base import MissingExtractorDependency, file_uri, get_file_mtime, output, prepare_files
 
 EXTENSIONS = {".jpg", ".jpeg", ".png", ".gif", ".webp", ".bmp"}
+PROMPT = "Describe this image in detail. Include any text visible in the image."
+DEFAULT_CONCURRENCY = 4
 
 
 def iter_records(
@@ -25,51 +27,70 @@ def iter_records(
     tag: Optional[list[str]] = None,
     model: Optional[str] = None,
     base_url: Optional[str] = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
 ) -> Iterator[Record]:
     """Yield ingest records describing images via an Ollama vision model.
 
     model/base_url default from env (OLLAMA_VISION_MODEL/OLLAMA_BASE_URL) so a generic
     caller (the `add` command) needs no extra args. Raises MissingExtractorDependency
     if Ollama is unreachable, so a whole image bucket is skipped rather than crashing.
+    Up to `concurrency` requests are in flight at once; records still come out in order.
     """
+    import httpx
+
     ollama_url = normalize_ollama_url(base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434"))
     vision_model = model or os.getenv("OLLAMA_VISION_MODEL", "llama3.2-vision")
 
-    for img_file in files:
-        try:
-            with open(img_file, "rb") as f:
-                image_data = base64.b64encode(f.read()).decode("utf-8")
+    # The request body is assembled as bytes around the base64 payload, which never needs
+    # JSON escaping, so large images aren't decoded to str and re-encoded by a JSON encoder.
+    body_head = json.dumps({"model": vision_model, "prompt": PROMPT, "stream": False})[:-1].encode() + b', "images": ["'
+    body_tail = b'"]}'
 
-            with httpx.Client(timeout=120.0) as client:
-                response = client.post(
-                    f"{ollama_url}/api/generate",
-                    json={
-                        "model": vision_model,
-                        "prompt": "Describe this image in detail. Include any text visible in the image.",
-                        "images": [image_data],
-                        "stream": False,
-                    },
-                )
-                response.raise_for_status()
-                description = response.json()["response"]
-        except httpx.ConnectError as e:
-            raise MissingExtractorDependency(f"Cannot connect to Ollama at {ollama_url}") from e
+    def describe(img_file: Path) -> str | None:
+        """Describe one image (runs on a pool thread). None on per-image errors."""
+        try:
+            image_b64 = base64.b64encode(img_file.read_bytes())
+            response = client.post(f"{ollama_url}/api/generate", content=body_head + image_b64 + body_tail)
+            response.raise_for_status()
+            return response.json()["response"]
+        except httpx.ConnectError:
+            raise
         except Exception as e:
             print(f"Error describing {img_file}: {e}", file=sys.stderr)
-            continue
+            return None
 
-        if not description or not description.strip():
-            continue
+    with (
+        httpx.Client(
+            timeout=120.0,
+            headers={"Content-Type": "application/json"},
+            limits=httpx.Limits(max_connections=concurrency),
+        ) as client,
+        ThreadPoolExecutor(max_workers=concurrency) as pool,
+    ):
+        try:
+            for img_file, description in zip(files, pool.map(describe, files)):
+                if not description or not description.strip():
+                    continue
 
-        yield Record(
-            source_uri=file_uri(img_file),
-            chunks=[{"text": description.strip(), "key": "description", "meta": {"original_filename": img_file.name}}],
-            tags=["image"] + (tag or []),
-            title=img_file.stem,
-            source_type="image",
-            context=json.dumps({"path": str(img_file), "vision_model": vision_model}),
-            created_at=get_file_mtime(img_file),
-        )
+                yield Record(
+                    source_uri=file_uri(img_file),
+                    chunks=[
+                        {
+                            "text": description.strip(),
+                            "key": "description",
+                            "meta": {"original_filename": img_file.name},
+                        }
+                    ],
+                    tags=["image"] + (tag or []),
+                    title=img_file.stem,
+                    source_type="image",
+                    context={"path": str(img_file), "vision_model": vision_model},
+                    created_at=get_file_mtime(img_file),
+                )
+        except httpx.ConnectError as e:
+            raise MissingExtractorDependency(f"Cannot connect to Ollama at {ollama_url}") from e
+        finally:
+            pool.shutdown(cancel_futures=True)
 
 
 def extract(
@@ -78,11 +99,18 @@ def extract(
     base_url: Annotated[str, typer.Option("--base-url", help="Ollama URL")] = "",
     force: Annotated[bool, typer.Option("--force", "-f", help="Re-process all files even if already ingested")] = False,
     tag: Annotated[Optional[list[str]], typer.Option("--tag", "-t", help="Additional tags")] = None,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-c", min=1, help="Concurrent requests to Ollama")
+    ] = DEFAULT_CONCURRENCY,
 ):
     """Extract image descriptions via Ollama vision model."""
     try:
         for rec in iter_records(
-            prepare_files(paths or [], EXTENSIONS, force), tag=tag, model=model or None, base_url=base_url or None
+            prepare_files(paths or [], EXTENSIONS, force),
+            tag=tag,
+            model=model or None,
+            base_url=base_url or None,
+            concurrency=concurrency,
         ):
             output(rec)
     except MissingExtractorDependency as e:
@@ -1,9 +1,8 @@
 """Extract markdown files, splitting by headings."""
 
-import json
 import re
-import sys
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 from typing import Annotated, Optional
 
@@ -11,17 +10,23 @@ import typer
 
 from uridx.record import Record
 
-from .base import file_uri, get_file_mtime, output, prepare_files
+from .base import DEFAULT_JOBS, file_uri, get_file_mtime, output, parallel_map, prepare_files
 
 EXTENSIONS = {".md", ".markdown"}
 MIN_CHUNK_SIZE = 100
 
+_SLUG_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
 
-def _heading_level(heading: str | None) -> int:
-    if not heading:
+
+def _heading_level(line: str) -> int:
+    """ATX heading level (1-6) of a line, or 0 if it isn't a heading.
+
+    A heading is 1-6 ``#`` at column 0, then a space/tab, then some text.
+    """
+    level = len(line) - len(line.lstrip("#"))
+    if not 1 <= level <= 6 or line[level : level + 1] not in (" ", "\t") or not line[level:].strip():
         return 0
-    match = re.match(r"^(#{1,6})\s+", heading)
-    return len(match.group(1)) if match else 0
+    return level
 
 
 def _merge_small_chunks(chunks: list[dict]) -> list[dict]:
@@ -43,63 +48,63 @@ def _merge_small_chunks(chunks: list[dict]) -> list[dict]:
     return merged
 
 
+@lru_cache(maxsize=4096)
 def _slugify(text: str) -> str:
+    """Slug for heading text (without the leading ``#``s); headings repeat a lot across files."""
     if not text:
         return "untitled"
-    text = re.sub(r"^#+\s*", "", text)
     text = text.lower()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
+    text = _SLUG_NONALNUM_RE.sub("-", text)
     return text.strip("-")[:50] or "untitled"
 
 
 def _parse(path: Path) -> list[dict]:
     content = path.read_text(encoding="utf-8")
-    heading_pattern = r"^(#{1,6}\s+.+)$"
-    parts = re.split(heading_pattern, content, flags=re.MULTILINE)
 
     chunks = []
     current_heading = None
-    current_content = []
+    current_title = ""  # heading text without the leading #s, for the chunk key
+    current_level = 0
+    current_lines: list[str] = []
     # Track parent headings by level: {level: heading_text}
     parent_headings: dict[int, str] = {}
 
     def _emit_chunk():
-        if not current_heading and not current_content:
+        body = "\n".join(current_lines).strip()
+        if not current_heading and not body:
             return
         text_parts = []
         # Prepend ancestor headings for context
         if current_heading:
-            level = _heading_level(current_heading)
-            ancestors = [parent_headings[lvl] for lvl in sorted(parent_headings) if lvl < level]
-            text_parts.extend(ancestors)
-        text_parts.append(current_heading or "")
-        text_parts.extend(current_content)
-        text_parts = [p for p in text_parts if p]
+            text_parts.extend(parent_headings[lvl] for lvl in sorted(parent_headings) if lvl < current_level)
+            text_parts.append(current_heading)
+        if body:
+            text_parts.append(body)
         chunk_text = "\n\n".join(text_parts)
         if chunk_text.strip():
             chunks.append(
                 {
                     "text": chunk_text,
-                    "key": _slugify(current_heading) if current_heading else f"section-{len(chunks)}",
+                    "key": _slugify(current_title) if current_heading else f"section-{len(chunks)}",
                     "meta": {"heading": current_heading},
                 }
             )
 
-    for part in parts:
-        part = part.strip()
-        if not part:
-            continue
-        level = _heading_level(part)
+    for line in content.splitlines():
+        # Body lines dominate; a one-character test keeps them out of _heading_level.
+        level = _heading_level(line) if line[:1] == "#" else 0
         if level:
             _emit_chunk()
-            current_heading = part
-            current_content = []
-            parent_headings[level] = part
+            current_heading = line.strip()
+            current_title = line[level:].strip()
+            current_level = level
+            current_lines = []
+            parent_headings[level] = current_heading
             # Clear any deeper headings
             for lvl in [k for k in parent_headings if k > level]:
                 del parent_headings[lvl]
         else:
-            current_content.append(part)
+            current_lines.append(line)
 
     _emit_chunk()
 
@@ -109,15 +114,9 @@ def _parse(path: Path) -> list[dict]:
     return _merge_small_chunks(chunks)
 
 
-def iter_records(files: list[Path], *, tag: Optional[list[str]] = None) -> Iterator[Record]:
-    """Yield ingest records for markdown files, splitting by headings."""
-    for md_file in files:
-        try:
-            chunks = _parse(md_file)
-        except Exception as e:
-            print(f"Error parsing {md_file}: {e}", file=sys.stderr)
-            continue
-
+def iter_records(files: list[Path], *, tag: Optional[list[str]] = None, jobs: int = 1) -> Iterator[Record]:
+    """Yield ingest records for markdown files, splitting by headings (parsed across `jobs` processes)."""
+    for md_file, chunks in zip(files, parallel_map(_parse, files, jobs)):
         if not chunks:
             continue
 
@@ -127,7 +126,7 @@ def iter_records(files: list[Path], *, tag: Optional[list[str]] = None) -> Itera
             tags=["markdown", "document"] + (tag or []),
             title=md_file.stem,
             source_type="markdown",
-            context=json.dumps({"path": str(md_file)}),
+            context={"path": str(md_file)},
             created_at=get_file_mtime(md_file),
         )
 
@@ -136,7 +135,8 @@ def extract(
     paths: Annotated[Optional[list[Path]], typer.Argument(help="Files or directories")] = None,
     force: Annotated[bool, typer.Option("--force", "-f", help="Re-process all files even if already ingested")] = False,
     tag: Annotated[Optional[list[str]], typer.Option("--tag", "-t", help="Additional tags")] = None,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="Parallel worker processes")] = DEFAULT_JOBS,
 ):
     """Extract markdown files, splitting by headings."""
-    for rec in iter_records(prepare_files(paths or [], EXTENSIONS, force), tag=tag):
+    for rec in iter_records(prepare_files(paths or [], EXTENSIONS, force), tag=tag, jobs=jobs):
         output(rec)
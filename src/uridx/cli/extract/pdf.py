@@ -1,6 +1,5 @@
 """Extract PDF files by page using pdfplumber."""
 
-import json
 import sys
 from collections.abc import Iterator
 from pathlib import Path
@@ -10,34 +9,40 @@ import typer
 
 from uridx.record import Record
 
-from .base import MissingExtractorDependency, file_uri, output, prepare_files
+from .base import DEFAULT_JOBS, MissingExtractorDependency, file_uri, output, parallel_map, prepare_files
 
 EXTENSIONS = {".pdf"}
 
 
-def iter_records(files: list[Path], *, tag: Optional[list[str]] = None) -> Iterator[Record]:
-    """Yield ingest records for PDF files, one chunk per page (requires pdfplumber)."""
+def _extract_pages(pdf_file: Path) -> list[dict]:
+    """One chunk per non-empty page; a page that fails to extract is reported and skipped."""
+    import pdfplumber
+
+    chunks = []
+    with pdfplumber.open(pdf_file) as pdf:
+        for i, page in enumerate(pdf.pages):
+            try:
+                text = page.extract_text()
+            except Exception as e:
+                print(f"Error extracting page {i + 1} from {pdf_file}: {e}", file=sys.stderr)
+                continue
+            if text and text.strip():
+                chunks.append({"text": text.strip(), "key": f"page-{i + 1}", "meta": {"page_number": i + 1}})
+    return chunks
+
+
+def iter_records(files: list[Path], *, tag: Optional[list[str]] = None, jobs: int = 1) -> Iterator[Record]:
+    """Yield ingest records for PDF files, one chunk per page (requires pdfplumber).
+
+    Files are extracted across `jobs` processes, one whole file per task; pdfplumber is
+    pure Python and CPU-bound.
+    """
     try:
-        import pdfplumber
+        import pdfplumber  # noqa: F401
     except ImportError as e:
         raise MissingExtractorDependency("pdfplumber not installed. Install with: uv pip install 'uridx[pdf]'") from e
 
-    for pdf_file in files:
-        chunks = []
-        try:
-            with pdfplumber.open(pdf_file) as pdf:
-                for i, page in enumerate(pdf.pages):
-                    try:
-                        text = page.extract_text()
-                    except Exception as e:
-                        print(f"Error extracting page {i + 1} from {pdf_file}: {e}", file=sys.stderr)
-                        continue
-                    if text and text.strip():
-                        chunks.append({"text": text.strip(), "key": f"page-{i + 1}", "meta": {"page_number": i + 1}})
-        except Exception as e:
-            print(f"Error processing {pdf_file}: {e}", file=sys.stderr)
-            continue
-
+    for pdf_file, chunks in zip(files, parallel_map(_extract_pages, files, jobs)):
         if not chunks:
             continue
 
@@ -47,7 +52,7 @@ def iter_records(files: list[Path], *, tag: Optional[list[str]] = None) -> Itera
             tags=["pdf", "document"] + (tag or []),
             title=pdf_file.stem,
             source_type="pdf",
-            context=json.dumps({"path": str(pdf_file), "pages": len(chunks)}),
+            context={"path": str(pdf_file), "pages": len(chunks)},
         )
 
 
@@ -55,10 +60,11 @@ def extract(
     paths: Annotated[Optional[list[Path]], typer.Argument(help="Files or directories")] = None,
     force: Annotated[bool, typer.Option("--force", "-f", help="Re-process all files even if already ingested")] = False,
     tag: Annotated[Optional[list[str]], typer.Option("--tag", "-t", help="Additional tags")] = None,
+    jobs: Annotated[int, typer.Option("--jobs", "-j", help="Parallel worker processes")] = DEFAULT_JOBS,
 ):
     """Extract PDF files by page (requires pdfplumber)."""
     try:
-        for rec in iter_records(prepare_files(paths or [], EXTENSIONS, force), tag=tag):
+        for rec in iter_records(prepare_files(paths or [], EXTENSIONS, force), tag=tag, jobs=jobs):
             output(rec)
     except MissingExtractorDependency as e:
         print(str(e), file=sys.stderr)
@@ -8,6 +8,8 @@ import importlib
 from pathlib import Path
 from typing import Optional
 
+from .base import iter_files
+
 # Extractor name -> module path
 MODULES = {
     "markdown": "uridx.cli.extract.markdown",
@@ -77,9 +79,8 @@ def resolve_dispatch(paths: list[str], extractor: Optional[str] = None) -> tuple
     for p in paths:
         path = Path(p)
         if path.is_dir():
-            for f in sorted(path.rglob("*")):
-                if f.is_file():
-                    classify(f)
+            for f in sorted(iter_files(path)):
+                classify(f)
         else:
             classify(path)  # a file, or a nonexistent path (no matching ext -> skipped)
 
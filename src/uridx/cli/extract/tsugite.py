@@ -48,13 +48,13 @@ def _build_turns(conn: sqlite3.Connection, session_id: str) -> list[ChunkInput]:
     def _emit() -> None:
         parts = []
         if current_user:
-            parts.append(f"User: {current_user}")
+            parts += ("User: ", current_user)
         if current_assistant:
-            parts.append(f"Assistant: {' '.join(current_assistant)}")
+            parts += ("\n\nAssistant: " if parts else "Assistant: ", " ".join(current_assistant))
         if parts:
             turns.append(
                 ChunkInput(
-                    text="\n\n".join(parts),
+                    text="".join(parts),
                     key=f"turn-{len(turns)}",
                     meta={"turn_index": len(turns)},
                 )
@@ -152,7 +152,7 @@ def extract(
                 tags=[agent_name, "conversation", "tsugite"] + (tag or []),
                 title=f"{agent_name}: {s['session_id']}",
                 source_type="tsugite",
-                context=json.dumps(metadata),
+                context=metadata,
                 created_at=s["created_at"],
             )
         )
@@ -1,5 +1,8 @@
 import json
+import queue
 import sys
+import threading
+from collections.abc import Iterator
 from dataclasses import asdict
 from datetime import datetime
 from typing import Annotated, Optional
@@ -13,23 +16,13 @@ from uridx.cli.extract import app as extract_app
 from uridx.cli.extract.base import MissingExtractorDependency, filter_existing_files
 from uridx.cli.extract.registry import load_extractor, resolve_dispatch
 from uridx.config import get_machine_id
-from uridx.db.engine import init_db
-from uridx.db.operations import (
-    add_item,
-    delete_item,
-    delete_items_by_prefix,
-    get_item,
-    get_stats,
-    ingest_record,
-    list_items_by_prefix,
-)
 from uridx.record import ChunkInput, Record
-from uridx.search.hybrid import hybrid_search
 
 app = typer.Typer()
 app.add_typer(extract_app, name="extract")
 
 SNIPPET_LIMIT = 400
+PREFETCH_DEPTH = 4
 
 
 def _snippet(text: str, limit: int = SNIPPET_LIMIT) -> str:
@@ -48,6 +41,47 @@ def _indent(text: str, prefix: str = "  ") -> str:
     return "\n".join(prefix + line for line in text.splitlines())
 
 
+def _prefetch(records: Iterator[Record], depth: int = PREFETCH_DEPTH) -> Iterator[Record]:
+    """Run `records` on a background thread, up to `depth` records ahead of the consumer.
+
+    Lets `add` extract the next file while the current record is embedded and written.
+    Exceptions from the extractor are re-raised here, in the consuming thread.
+    """
+    q: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+
+    def put(kind: str, value) -> bool:
+        while not stop.is_set():
+            try:
+                q.put((kind, value), timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def produce():
+        try:
+            for rec in records:
+                if not put("record", rec):
+                    return
+        except BaseException as e:
+            put("error", e)
+        else:
+            put("end", None)
+
+    threading.Thread(target=produce, daemon=True).start()
+    try:
+        while True:
+            kind, value = q.get()
+            if kind == "end":
+                return
+            if kind == "error":
+                raise value
+            yield value
+    finally:
+        stop.set()  # the producer stops at its next put if we bail out early
+
+
 @app.command()
 def search(
     query: str,
@@ -64,6 +98,10 @@ def search(
     source_prefix: Annotated[Optional[str], typer.Option("--source-prefix")] = None,
     after: Annotated[Optional[datetime], typer.Option("--after")] = None,
 ):
+    # DB/search imports are deferred so `extract` and `--help` don't pay for sqlmodel + sqlite-vec.
+    from uridx.db.engine import init_db
+    from uridx.search.hybrid import hybrid_search
+
     init_db()
     results = hybrid_search(
         query,
@@ -104,6 +142,9 @@ def ingest(
     text: Annotated[Optional[str], typer.Option("--text")] = None,
     tag: Annotated[Optional[list[str]], typer.Option("--tag", "-t", help="Tags for ingested items")] = None,
 ):
+    from uridx.db.engine import get_session, init_db
+    from uridx.db.operations import PENDING_EMBEDDINGS_LIMIT, add_item, flush_embeddings, ingest_record
+
     init_db()
     console = Console(stderr=True)
 
@@ -118,26 +159,58 @@ def ingest(
             )
         print(json.dumps({"source_uri": item.source_uri, "chunks": len(item.chunks)}))
     else:
-        lines = [line.strip() for line in sys.stdin if line.strip()]
+        # Raw bytes: pydantic parses JSON from bytes directly, skipping a per-line decode.
+        lines = [line for line in (raw.strip() for raw in sys.stdin.buffer) if line]
         count = 0
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            MofNCompleteColumn(),
-            console=console,
-        ) as progress:
+        pending = []  # chunks awaiting embeddings, shared across records (see add_item)
+        committed = 0  # lines[:committed] are committed
+        # One session for the whole stream, committed at each embedding flush rather than per
+        # record, so no item is ever committed without its vectors. If a record fails, the
+        # uncommitted ones before it are redone and kept; if the embedding backend fails, the
+        # records since the last commit (at most PENDING_EMBEDDINGS_LIMIT chunks' worth) are discarded.
+        with (
+            get_session() as session,
+            Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                MofNCompleteColumn(),
+                console=console,
+            ) as progress,
+        ):
             task = progress.add_task("Ingesting...", total=len(lines))
             for i, line in enumerate(lines, 1):
                 try:
                     record = Record.model_validate_json(line)
                 except ValidationError as e:
+                    flush_embeddings(session, pending)
+                    session.commit()  # keep the records before the bad line
                     print(f"Error: invalid record on line {i}:\n{e}", file=sys.stderr)
                     raise typer.Exit(1)
                 progress.update(task, description=f"{record.source_uri[:60]}")
-                ingest_record(record, extra_tags=tag)
+                try:
+                    ingest_record(record, extra_tags=tag, session=session, pending=pending)
+                except Exception:
+                    # No savepoints under pysqlite's implicit transactions: drop the whole
+                    # uncommitted window, then redo the records before this one.
+                    session.rollback()
+                    pending.clear()
+                    for prev in lines[committed : i - 1]:
+                        ingest_record(
+                            Record.model_validate_json(prev), extra_tags=tag, session=session, pending=pending
+                        )
+                    flush_embeddings(session, pending)
+                    session.commit()  # keep the records before the failing one
+                    print(f"Error: failed to ingest line {i} ({record.source_uri})", file=sys.stderr)
+                    raise
+                if len(pending) >= PENDING_EMBEDDINGS_LIMIT:
+                    flush_embeddings(session, pending)
+                    session.commit()
+                    committed = i
                 count += 1
                 progress.advance(task)
+            flush_embeddings(session, pending)
+            session.commit()
         print(json.dumps({"ingested": count}))
 
 
@@ -178,6 +251,9 @@ def add(
             print(f"{f}\t(no extractor)")
         return
 
+    from uridx.db.engine import init_db
+    from uridx.db.operations import ingest_record
+
     init_db()
     console = Console(stderr=True)
 
@@ -201,7 +277,8 @@ def add(
         for name, survivors in plan:
             module = load_extractor(name)
             try:
-                for rec in module.iter_records(survivors, tag=tag):
+                # Extraction (parsing, vision calls) overlaps with embedding/writing the previous record.
+                for rec in _prefetch(module.iter_records(survivors, tag=tag)):
                     ingest_record(rec)
                     ingested += 1
                     stype = rec.source_type or name
@@ -238,6 +315,9 @@ def delete(
         print("Error: provide only one of --uri or --source-prefix", file=sys.stderr)
         raise typer.Exit(1)
 
+    from uridx.db.engine import init_db
+    from uridx.db.operations import delete_item, delete_items_by_prefix, get_item, list_items_by_prefix
+
     init_db()
 
     if uri:
@@ -261,6 +341,9 @@ def delete(
 
 @app.command()
 def stats():
+    from uridx.db.engine import init_db
+    from uridx.db.operations import get_stats
+
     init_db()
     print(json.dumps(get_stats(), indent=2))
 
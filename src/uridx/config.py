@@ -9,6 +9,10 @@ FASTEMBED_MODEL = os.getenv("FASTEMBED_MODEL", "nomic-ai/nomic-embed-text-v1.5")
 
 OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
 OLLAMA_EMBED_MODEL = os.getenv("OLLAMA_EMBED_MODEL", "qwen3-embedding:0.6b")
+# Storage type of new vector indexes: "float32" or "int8" (4x smaller, scaled per vector and
+# compared by cosine distance). An existing database keeps the type it was created with.
+URIDX_EMBEDDING_DTYPE = os.getenv("URIDX_EMBEDDING_DTYPE", "float32")
+OLLAMA_EMBED_BATCH_SIZE = int(os.getenv("OLLAMA_EMBED_BATCH_SIZE", "32"))  # texts per /api/embed request
 
 
 def normalize_ollama_url(url: str) -> str:
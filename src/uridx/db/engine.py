@@ -2,14 +2,25 @@ import sqlite3
 from pathlib import Path
 
 import sqlite_vec
+from sqlalchemy.exc import OperationalError
 from sqlmodel import Session, SQLModel, create_engine
 
-from uridx.config import URIDX_DB_PATH
+from uridx.config import URIDX_DB_PATH, URIDX_EMBEDDING_DTYPE
 from uridx.db.models import Setting
 from uridx.embeddings import get_dimension
 
 _engine = None
 
+# Bump whenever init_db's DDL/migrations change, so stamped databases re-run them once.
+SCHEMA_VERSION = "1"
+
+# vec0 column type per embedding dtype, and the SQL that binds a serialized vector of it.
+# int8 vectors are scaled per vector (see serialize_embedding), so they use cosine distance.
+VEC_COLUMNS = {"float32": "float[{dim}]", "int8": "int8[{dim}] distance_metric=cosine"}
+VEC_PARAMS = {"float32": "?", "int8": "vec_int8(?)"}
+
+_embedding_dtype = "float32"
+
 
 def _ensure_fts_table(cursor):
     """Ensure FTS table exists with correct configuration, migrating if needed."""
@@ -73,11 +84,18 @@ def _ensure_fts_table(cursor):
             cursor.execute("INSERT INTO chunks_fts(rowid, text) SELECT id, text FROM chunk")
 
 
-def _set_sqlite_pragmas(dbapi_conn, connection_record):
+def _on_connect(dbapi_conn, connection_record):
     cursor = dbapi_conn.cursor()
     cursor.execute("PRAGMA journal_mode=WAL")
     cursor.execute("PRAGMA busy_timeout=5000")
+    # WAL + NORMAL only syncs at checkpoints; a crash can lose the last commits, never corrupt.
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA cache_size=-65536")  # 64 MiB
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA mmap_size=268435456")  # 256 MiB
     cursor.close()
+    # Load sqlite-vec on pooled connections too, so vec0 tables work through the engine.
+    _load_extensions(dbapi_conn)
 
 
 def get_engine():
@@ -95,7 +113,7 @@ def get_engine():
 
     from sqlalchemy import event
 
-    event.listen(_engine, "connect", _set_sqlite_pragmas)
+    event.listen(_engine, "connect", _on_connect)
 
     return _engine
 
@@ -106,27 +124,52 @@ def _load_extensions(conn: sqlite3.Connection):
     conn.enable_load_extension(False)
 
 
-def get_raw_connection() -> sqlite3.Connection:
-    db_path = Path(URIDX_DB_PATH)
-    conn = sqlite3.connect(str(db_path))
-    conn.execute("PRAGMA journal_mode=WAL")
-    conn.execute("PRAGMA busy_timeout=5000")
-    _load_extensions(conn)
-    return conn
+def get_raw_connection():
+    """A DBAPI connection checked out from the engine's pool.
+
+    Pragmas and sqlite-vec were applied once when the pool opened it (see _on_connect);
+    close() hands it back to the pool instead of closing the file.
+    """
+    return get_engine().raw_connection()
 
 
 def get_session() -> Session:
-    return Session(get_engine())
+    # Objects keep their loaded state after commit, so returning/detaching them needs no re-SELECT.
+    return Session(get_engine(), expire_on_commit=False)
 
 
 _db_initialized = False
 
 
+def get_embedding_dtype() -> str:
+    """Element type of chunk_embeddings ("float32" or "int8"), as recorded by init_db."""
+    return _embedding_dtype
+
+
+def _startup_settings(engine) -> dict[str, str]:
+    """The schema_version/embed_dtype settings, or {} for a new database."""
+    with engine.connect() as conn:
+        try:
+            rows = conn.exec_driver_sql(
+                "SELECT key, value FROM setting WHERE key IN ('schema_version', 'embed_dtype')"
+            ).all()
+        except OperationalError:  # no setting table yet
+            return {}
+    return dict(rows)
+
+
 def init_db():
-    global _db_initialized
+    global _db_initialized, _embedding_dtype
     if _db_initialized:
         return
     engine = get_engine()
+    settings = _startup_settings(engine)
+    if settings.get("schema_version") == SCHEMA_VERSION:
+        # Databases from before embed_dtype existed are float32.
+        _embedding_dtype = settings.get("embed_dtype", "float32")
+        _db_initialized = True
+        return
+
     SQLModel.metadata.create_all(engine)
 
     with get_session() as session:
@@ -136,38 +179,45 @@ def init_db():
         else:
             embed_dim = get_dimension()
             session.add(Setting(key="embed_dimension", value=str(embed_dim)))
-            session.commit()
-
-    conn = get_raw_connection()
-    cursor = conn.cursor()
-
-    # Migration: add content_hash column if missing
-    cursor.execute("PRAGMA table_info(item)")
-    columns = [row[1] for row in cursor.fetchall()]
-    if "content_hash" not in columns:
-        cursor.execute("ALTER TABLE item ADD COLUMN content_hash TEXT")
-
-    # Migration: populate location table for existing items without locations
-    # SQLModel creates the table, but we need to populate it for pre-existing items
-    cursor.execute("""
-        INSERT OR IGNORE INTO location (item_id, uri, added_at)
-        SELECT id, source_uri, created_at FROM item
-        WHERE id NOT IN (SELECT DISTINCT item_id FROM location)
-    """)
-
-    cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='chunk_embeddings'")
-    if not cursor.fetchone():
-        cursor.execute(
-            f"""
-            CREATE VIRTUAL TABLE chunk_embeddings USING vec0(
-                chunk_id INTEGER PRIMARY KEY,
-                embedding float[{embed_dim}]
+
+        # Raw DDL runs on the session's own (pooled) connection, in the same transaction.
+        cursor = session.connection().connection.cursor()
+
+        # Migration: add content_hash column if missing
+        cursor.execute("PRAGMA table_info(item)")
+        columns = [row[1] for row in cursor.fetchall()]
+        if "content_hash" not in columns:
+            cursor.execute("ALTER TABLE item ADD COLUMN content_hash TEXT")
+
+        # Migration: populate location table for existing items without locations
+        # SQLModel creates the table, but we need to populate it for pre-existing items
+        cursor.execute("""
+            INSERT OR IGNORE INTO location (item_id, uri, added_at)
+            SELECT id, source_uri, created_at FROM item
+            WHERE id NOT IN (SELECT DISTINCT item_id FROM location)
+        """)
+
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='chunk_embeddings'")
+        if not cursor.fetchone():
+            embed_dtype = URIDX_EMBEDDING_DTYPE
+            if embed_dtype not in VEC_COLUMNS:
+                raise ValueError(f"URIDX_EMBEDDING_DTYPE must be one of {', '.join(VEC_COLUMNS)}, not {embed_dtype!r}")
+            cursor.execute(
+                f"""
+                CREATE VIRTUAL TABLE chunk_embeddings USING vec0(
+                    chunk_id INTEGER PRIMARY KEY,
+                    embedding {VEC_COLUMNS[embed_dtype].format(dim=embed_dim)}
+                )
+                """
             )
-            """
-        )
+            session.merge(Setting(key="embed_dtype", value=embed_dtype))
+        else:
+            existing_dtype = session.get(Setting, "embed_dtype")
+            embed_dtype = existing_dtype.value if existing_dtype else "float32"
 
-    _ensure_fts_table(cursor)
+        _ensure_fts_table(cursor)
 
-    conn.commit()
-    conn.close()
+        session.merge(Setting(key="schema_version", value=SCHEMA_VERSION))
+        session.commit()
+    _embedding_dtype = embed_dtype
     _db_initialized = True
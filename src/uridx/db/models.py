@@ -1,7 +1,11 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Optional
 
-from sqlmodel import Field, Relationship, SQLModel
+from sqlmodel import Field, Relationship, SQLModel, func
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
 
 
 class Tag(SQLModel, table=True):
@@ -16,7 +20,7 @@ class Location(SQLModel, table=True):
     item_id: int = Field(foreign_key="item.id", index=True)
     uri: str = Field(index=True)
     machine: Optional[str] = Field(default=None, index=True)
-    added_at: datetime = Field(default_factory=datetime.utcnow)
+    added_at: datetime = Field(default_factory=_utcnow)
 
     item: "Item" = Relationship(back_populates="locations")
 
@@ -28,7 +32,7 @@ class Chunk(SQLModel, table=True):
     chunk_index: Optional[int] = None
     text: str
     meta: Optional[str] = None
-    created_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
 
     item: "Item" = Relationship(back_populates="chunks")
 
@@ -41,8 +45,12 @@ class Item(SQLModel, table=True):
     context: Optional[str] = None
     content_hash: Optional[str] = Field(default=None, index=True)
     expires_at: Optional[datetime] = Field(default=None, index=True)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    created_at: datetime = Field(default_factory=_utcnow)
+    # Touched by SQLite on UPDATE (see add_item), not by a Python-side clock.
+    updated_at: datetime = Field(
+        default_factory=_utcnow,
+        sa_column_kwargs={"server_default": func.current_timestamp(), "onupdate": func.current_timestamp()},
+    )
 
     chunks: list[Chunk] = Relationship(back_populates="item", cascade_delete=True)
     tags: list[Tag] = Relationship(back_populates="item", cascade_delete=True)
@@ -52,4 +60,4 @@ class Item(SQLModel, table=True):
 class Setting(SQLModel, table=True):
     key: str = Field(primary_key=True)
     value: str
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=_utcnow)
@@ -1,16 +1,31 @@
 import hashlib
 import json
 import sys
-from datetime import datetime
+from datetime import datetime, timezone
+from itertools import chain
 
-from sqlmodel import func, select
+from sqlalchemy import inspect
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlmodel import Session, delete, func, or_, select
 
 from uridx.config import get_machine_id
-from uridx.db.engine import get_raw_connection, get_session
+from uridx.db.engine import VEC_PARAMS, get_embedding_dtype, get_session
 from uridx.db.models import Chunk, Item, Location, Tag
-from uridx.embeddings import get_embeddings_sync, serialize_embedding
+from uridx.embeddings import iter_embeddings_sync, serialize_embedding
 from uridx.record import ChunkInput, Record
 
+# Rows per multi-row INSERT into chunk_embeddings: 2 bound params each, kept under
+# SQLite's historical 999-parameter limit (SQLITE_MAX_VARIABLE_NUMBER before 3.32).
+EMBEDDING_INSERT_BATCH = 499
+
+# Deferred chunks (see add_item's `pending`) worth one embedding call; the backend sub-batches it.
+PENDING_EMBEDDINGS_LIMIT = 256
+
+# Eager-load every relationship of the Items a query returns (one SELECT per relationship,
+# not per item), for callers that detach or cascade-delete them.
+_ITEM_RELATIONSHIPS = (selectinload(Item.chunks), selectinload(Item.tags), selectinload(Item.locations))
+
 
 def compute_content_hash(chunks: list[ChunkInput]) -> str:
     """Compute SHA256 hash of chunk texts for change detection."""
@@ -18,15 +33,38 @@ def compute_content_hash(chunks: list[ChunkInput]) -> str:
     return hashlib.sha256(content.encode()).hexdigest()[:32]
 
 
-def _delete_chunk_embeddings(chunk_ids: list[int]) -> None:
+def _delete_chunk_embeddings(session, chunk_ids: list[int]) -> None:
     if not chunk_ids:
         return
-    conn = get_raw_connection()
-    cursor = conn.cursor()
     placeholders = ",".join("?" * len(chunk_ids))
-    cursor.execute(f"DELETE FROM chunk_embeddings WHERE chunk_id IN ({placeholders})", chunk_ids)
-    conn.commit()
-    conn.close()
+    session.connection().exec_driver_sql(
+        f"DELETE FROM chunk_embeddings WHERE chunk_id IN ({placeholders})", tuple(chunk_ids)
+    )
+
+
+def _embeddings_by_text(session, chunks: list[Chunk]) -> dict[str, bytes]:
+    """Stored embedding blobs keyed by chunk text, so a re-ingested item only embeds changed chunks."""
+    if not chunks:
+        return {}
+    text_by_id = {c.id: c.text for c in chunks}
+    placeholders = ",".join("?" * len(text_by_id))
+    rows = session.connection().exec_driver_sql(
+        f"SELECT chunk_id, embedding FROM chunk_embeddings WHERE chunk_id IN ({placeholders})", tuple(text_by_id)
+    )
+    return {text_by_id[chunk_id]: embedding for chunk_id, embedding in rows}
+
+
+def _insert_chunk_embeddings(session, rows: list[tuple[int, bytes]]) -> None:
+    """Insert (chunk_id, embedding) rows with one multi-row VALUES statement per batch."""
+    conn = session.connection()
+    row_sql = f"(?, {VEC_PARAMS[get_embedding_dtype()]})"
+    for start in range(0, len(rows), EMBEDDING_INSERT_BATCH):
+        batch = rows[start : start + EMBEDDING_INSERT_BATCH]
+        placeholders = ",".join([row_sql] * len(batch))
+        conn.exec_driver_sql(
+            f"INSERT INTO chunk_embeddings (chunk_id, embedding) VALUES {placeholders}",
+            tuple(chain.from_iterable(batch)),
+        )
 
 
 def _ensure_location(session, item_id: int, uri: str, machine: str | None) -> None:
@@ -56,6 +94,52 @@ def add_item(
     expires_at: datetime | None = None,
     created_at: datetime | str | None = None,
     machine: str | None = None,
+    session: Session | None = None,
+    pending: list[Chunk] | None = None,
+) -> Item:
+    """Add (or update/dedup) an item and embed its chunks.
+
+    With `session`, everything (embeddings included) is written in that session's
+    transaction and the caller commits; the Item returned is still attached. Without
+    it, the item is committed in its own session and returned detached.
+
+    With `session`, a `pending` list defers embedding: chunks needing vectors are
+    appended to it, and the caller stores them (for many records at once) with
+    flush_embeddings() before committing.
+    """
+    fields = dict(
+        title=title,
+        source_type=source_type,
+        context=context,
+        chunks=chunks,
+        tags=tags,
+        expires_at=expires_at,
+        created_at=created_at,
+        machine=machine,
+    )
+    if session is not None:
+        return _add_item_in_session(session, source_uri, pending=pending, **fields)
+
+    with get_session() as session:
+        item = _add_item_in_session(session, source_uri, **fields)
+        session.commit()
+        if inspect(item).expired_attributes:  # DB-computed values, e.g. a touched updated_at
+            session.refresh(item, attribute_names=list(inspect(item).expired_attributes))
+        return _detach_item(session, item)
+
+
+def _add_item_in_session(
+    session,
+    source_uri: str,
+    title: str | None,
+    source_type: str | None,
+    context: str | None,
+    chunks: list[ChunkInput] | None,
+    tags: list[str] | None,
+    expires_at: datetime | None,
+    created_at: datetime | str | None,
+    machine: str | None,
+    pending: list[Chunk] | None = None,
 ) -> Item:
     chunks = chunks or []
     tags = list(dict.fromkeys(tags or []))
@@ -65,98 +149,112 @@ def add_item(
     if isinstance(created_at, str):
         created_at = datetime.fromisoformat(created_at.replace("Z", "+00:00"))
 
-    with get_session() as session:
-        existing = session.exec(select(Item).where(Item.source_uri == source_uri)).first()
-
-        if existing and existing.content_hash == new_hash:
-            print(f"  Skipping {source_uri} (unchanged)", file=sys.stderr)
-            _ensure_location(session, existing.id, source_uri, machine)
-            existing.title = title
-            existing.source_type = source_type
-            existing.context = context
-            existing.expires_at = expires_at
-            existing.updated_at = datetime.utcnow()
-
-            existing_tags = {t.tag for t in existing.tags}
-            if existing_tags != set(tags):
-                for tag in list(existing.tags):
-                    session.delete(tag)
-                for tag_name in tags:
-                    session.add(Tag(item_id=existing.id, tag=tag_name))
-
-            session.commit()
-            session.refresh(existing)
-            return _detach_item(session, existing)
-
-        if existing:
-            _delete_item_in_session(session, existing)
-            session.commit()
-
-        # Check if content_hash matches another item (merge case)
-        hash_match = session.exec(select(Item).where(Item.content_hash == new_hash)).first()
-        if hash_match:
-            print(f"  Merging {source_uri} into {hash_match.source_uri}", file=sys.stderr)
-            _ensure_location(session, hash_match.id, source_uri, machine)
-            existing_tags = {t.tag for t in hash_match.tags}
-            for tag_name in tags:
-                if tag_name not in existing_tags:
-                    session.add(Tag(item_id=hash_match.id, tag=tag_name))
-            hash_match.updated_at = datetime.utcnow()
-            session.commit()
-            session.refresh(hash_match)
-            return _detach_item(session, hash_match)
-
-        item = Item(
-            source_uri=source_uri,
-            title=title,
-            source_type=source_type,
-            context=context,
-            content_hash=new_hash,
-            expires_at=expires_at,
-            created_at=created_at or datetime.utcnow(),
-            updated_at=created_at or datetime.utcnow(),
-        )
-        session.add(item)
-        session.flush()
-
-        chunk_records = []
-        texts_to_embed = []
-
-        for idx, chunk_data in enumerate(chunks):
-            chunk_record = Chunk(
-                item_id=item.id,
-                chunk_key=chunk_data.key,
-                chunk_index=idx,
-                text=chunk_data.text,
-                meta=json.dumps(chunk_data.meta) if chunk_data.meta else None,
-            )
-            session.add(chunk_record)
-            chunk_records.append(chunk_record)
-            texts_to_embed.append(chunk_data.text)
-
+    # One lookup for both the item at this URI and the oldest item with identical content
+    # (the merge target): the URI match sorts first, so two rows cover both.
+    same_uri = Item.source_uri == source_uri
+    candidates = session.exec(
+        select(Item).where(or_(same_uri, Item.content_hash == new_hash)).order_by(same_uri.desc(), Item.id).limit(2)
+    ).all()
+    existing = next((c for c in candidates if c.source_uri == source_uri), None)
+    hash_match = next((c for c in candidates if c.source_uri != source_uri and c.content_hash == new_hash), None)
+
+    if existing and existing.content_hash == new_hash:
+        print(f"  Skipping {source_uri} (unchanged)", file=sys.stderr)
+        _ensure_location(session, existing.id, source_uri, machine)
+        existing.title = title
+        existing.source_type = source_type
+        existing.context = context
+        existing.expires_at = expires_at
+        existing.updated_at = func.current_timestamp()
+
+        existing_tags = {t.tag for t in existing.tags}
+        if existing_tags != set(tags):
+            # One DELETE for the whole tag set; the collection is then reset to the new rows
+            # so later reads (e.g. a merge in the same session) don't see the deleted ones.
+            session.exec(delete(Tag).where(Tag.item_id == existing.id))
+            new_tags = [Tag(item_id=existing.id, tag=tag_name) for tag_name in tags]
+            session.add_all(new_tags)
+            set_committed_value(existing, "tags", new_tags)
+        return existing
+
+    reusable: dict[str, bytes] = {}
+    if existing:
+        # Deferred vectors may belong to the chunks about to be deleted; store them first.
+        flush_embeddings(session, pending)
+        reusable = _embeddings_by_text(session, existing.chunks)
+        _delete_item_in_session(session, existing)
         session.flush()
 
+    # Content matches another item (merge case)
+    if hash_match:
+        print(f"  Merging {source_uri} into {hash_match.source_uri}", file=sys.stderr)
+        _ensure_location(session, hash_match.id, source_uri, machine)
+        existing_tags = {t.tag for t in hash_match.tags}
         for tag_name in tags:
-            session.add(Tag(item_id=item.id, tag=tag_name))
+            if tag_name not in existing_tags:
+                hash_match.tags.append(Tag(item_id=hash_match.id, tag=tag_name))
+        hash_match.updated_at = func.current_timestamp()
+        return hash_match
+
+    chunk_records = [
+        Chunk(
+            chunk_key=chunk_data.key,
+            chunk_index=idx,
+            text=chunk_data.text,
+            meta=json.dumps(chunk_data.meta) if chunk_data.meta else None,
+        )
+        for idx, chunk_data in enumerate(chunks)
+    ]
+    created_at = created_at or datetime.now(timezone.utc)
+    # Built as one object graph: a single flush inserts the item and its rows (filling in
+    # item_id), and the collections are already populated without a SELECT.
+    item = Item(
+        source_uri=source_uri,
+        title=title,
+        source_type=source_type,
+        context=context,
+        content_hash=new_hash,
+        expires_at=expires_at,
+        created_at=created_at,
+        updated_at=created_at,
+        chunks=chunk_records,
+        tags=[Tag(tag=tag_name) for tag_name in tags],
+        locations=[Location(uri=source_uri, machine=machine)],
+    )
+    session.add(item)
+    session.flush()  # chunk ids, for the embeddings below
+
+    # Chunks whose text survived a re-ingest keep their vectors; only new text is embedded.
+    reused = [(cr.id, reusable[cr.text]) for cr in chunk_records if cr.text in reusable]
+    if reused:
+        _insert_chunk_embeddings(session, reused)
+    to_embed = [cr for cr in chunk_records if cr.text not in reusable]
+    if pending is not None:
+        pending.extend(to_embed)
+    else:
+        flush_embeddings(session, to_embed)
 
-        session.add(Location(item_id=item.id, uri=source_uri, machine=machine))
+    return item
 
-        session.commit()
 
-        if texts_to_embed:
-            embeddings = get_embeddings_sync(texts_to_embed)
-            conn = get_raw_connection()
-            cursor = conn.cursor()
-            for chunk_record, embedding in zip(chunk_records, embeddings):
-                cursor.execute(
-                    "INSERT INTO chunk_embeddings (chunk_id, embedding) VALUES (?, ?)",
-                    (chunk_record.id, serialize_embedding(embedding)),
-                )
-            conn.commit()
-            conn.close()
-
-        session.refresh(item)
-        return _detach_item(session, item)
+def flush_embeddings(session, pending: list[Chunk] | None) -> None:
+    """Embed the (flushed) chunks in `pending` with one backend call, store the vectors, clear it.
+
+    Each batch of vectors is inserted as it arrives, while the backend works on the next.
+    """
+    if not pending:
+        return
+    dtype = get_embedding_dtype()
+    done = 0
+    for embeddings in iter_embeddings_sync([c.text for c in pending]):
+        batch = pending[done : done + len(embeddings)]
+        # Same connection as the ORM writes: one transaction, and no second writer
+        # waiting on this session's lock.
+        _insert_chunk_embeddings(
+            session, [(c.id, serialize_embedding(emb, dtype)) for c, emb in zip(batch, embeddings)]
+        )
+        done += len(embeddings)
+    pending.clear()
 
 
 def ingest_record(
@@ -164,34 +262,41 @@ def ingest_record(
     *,
     extra_tags: list[str] | None = None,
     default_machine: str | None = None,
+    session: Session | None = None,
+    pending: list[Chunk] | None = None,
 ) -> Item:
     """Ingest one Record (the contract extractors emit) via add_item.
 
     Shared by the `ingest` and `add` CLI commands. Does NOT init the DB — the
-    caller must call init_db() once before looping.
+    caller must call init_db() once before looping. Pass `session` to batch many
+    records into one transaction, and `pending` to batch their embeddings too
+    (see add_item).
     """
     tags = (record.tags + (extra_tags or [])) or None  # add_item dedups
     machine = record.machine or default_machine or get_machine_id()
+    context = json.dumps(record.context) if isinstance(record.context, dict) else record.context
     return add_item(
         source_uri=record.source_uri,
         title=record.title,
-        context=record.context,
+        context=context,
         source_type=record.source_type,
         tags=tags,
         chunks=record.chunks,
         created_at=record.created_at,
         machine=machine,
+        session=session,
+        pending=pending,
     )
 
 
 def _delete_item_in_session(session, item: Item) -> None:
-    _delete_chunk_embeddings([c.id for c in item.chunks])
+    _delete_chunk_embeddings(session, [c.id for c in item.chunks])
     session.delete(item)
 
 
 def delete_item(source_uri: str) -> bool:
     with get_session() as session:
-        item = session.exec(select(Item).where(Item.source_uri == source_uri)).first()
+        item = session.exec(select(Item).where(Item.source_uri == source_uri).options(*_ITEM_RELATIONSHIPS)).first()
         if not item:
             return False
         _delete_item_in_session(session, item)
@@ -203,9 +308,9 @@ def delete_items_by_prefix(prefix: str) -> int:
     if not prefix:
         raise ValueError("prefix must not be empty")
     with get_session() as session:
-        items = session.exec(select(Item).where(Item.source_uri.startswith(prefix))).all()
+        items = session.exec(select(Item).where(Item.source_uri.startswith(prefix)).options(*_ITEM_RELATIONSHIPS)).all()
         all_chunk_ids = [c.id for item in items for c in item.chunks]
-        _delete_chunk_embeddings(all_chunk_ids)
+        _delete_chunk_embeddings(session, all_chunk_ids)
         for item in items:
             session.delete(item)
         session.commit()
@@ -216,7 +321,7 @@ def list_items_by_prefix(prefix: str) -> list[Item]:
     if not prefix:
         raise ValueError("prefix must not be empty")
     with get_session() as session:
-        items = session.exec(select(Item).where(Item.source_uri.startswith(prefix))).all()
+        items = session.exec(select(Item).where(Item.source_uri.startswith(prefix)).options(*_ITEM_RELATIONSHIPS)).all()
         for item in items:
             _detach_item(session, item)
         return items
@@ -224,11 +329,11 @@ def list_items_by_prefix(prefix: str) -> list[Item]:
 
 def get_item(source_uri: str) -> Item | None:
     with get_session() as session:
-        item = session.exec(select(Item).where(Item.source_uri == source_uri)).first()
+        item = session.exec(select(Item).where(Item.source_uri == source_uri).options(*_ITEM_RELATIONSHIPS)).first()
         if not item:
             loc = session.exec(select(Location).where(Location.uri == source_uri)).first()
             if loc:
-                item = session.get(Item, loc.item_id)
+                item = session.get(Item, loc.item_id, options=_ITEM_RELATIONSHIPS)
         if not item:
             return None
 
@@ -237,9 +342,12 @@ def get_item(source_uri: str) -> Item | None:
 
 def get_stats() -> dict:
     with get_session() as session:
-        items_count = session.exec(select(func.count(Item.id))).one()
-        chunks_count = session.exec(select(func.count(Chunk.id))).one()
-        tags_count = session.exec(select(func.count()).select_from(Tag)).one()
+        chunks_count, tags_count = session.exec(
+            select(
+                select(func.count(Chunk.id)).scalar_subquery(),
+                select(func.count()).select_from(Tag).scalar_subquery(),
+            )
+        ).one()
 
         source_types_result = session.exec(
             select(Item.source_type, func.count(Item.id)).group_by(Item.source_type)
@@ -248,7 +356,8 @@ def get_stats() -> dict:
         source_types = {st or "unknown": count for st, count in source_types_result}
 
         return {
-            "items": items_count,
+            # Every item is in exactly one source_type group, so no separate COUNT(*) is needed.
+            "items": sum(count for _, count in source_types_result),
             "chunks": chunks_count,
             "tags": tags_count,
             "source_types": source_types,
@@ -1,4 +1,6 @@
 import struct
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
 
 from uridx.config import (
     FASTEMBED_MODEL,
@@ -23,28 +25,53 @@ def get_dimension() -> int:
     return mod.get_dimension(*args)
 
 
-def get_embeddings_sync(texts: list[str]) -> list[list[float]]:
+def get_embeddings_sync(texts: list[str]) -> list[Sequence[float]]:
     mod, args = _backend()
     return mod.get_embeddings_sync(texts, *args)
 
 
-async def get_embeddings(texts: list[str]) -> list[list[float]]:
+def iter_embeddings_sync(texts: list[str]) -> Iterator[list[Sequence[float]]]:
+    """Embeddings for `texts` in consecutive batches, each yielded as soon as it is ready."""
+    mod, args = _backend()
+    return mod.iter_embeddings_sync(texts, *args)
+
+
+async def get_embeddings(texts: list[str]) -> list[Sequence[float]]:
     mod, args = _backend()
     return await mod.get_embeddings(texts, *args)
 
 
-def serialize_embedding(embedding: list[float]) -> bytes:
-    return struct.pack(f"{len(embedding)}f", *embedding)
+@lru_cache(maxsize=8)
+def _vector_struct(code: str, dim: int) -> struct.Struct:
+    return struct.Struct(f"{dim}{code}")
+
+
+def serialize_embedding(embedding: Sequence[float], dtype: str = "float32") -> bytes:
+    """sqlite-vec BLOB of float32 or int8 elements.
+
+    numpy arrays (fastembed) are converted in bulk, lists via a cached Struct. int8 scales
+    each vector so its largest component maps to 127; cosine distance ignores that scale.
+    """
+    if dtype == "int8":
+        if hasattr(embedding, "tobytes"):
+            peak = float(abs(embedding).max()) or 1.0
+            return (embedding * (127 / peak)).round().astype("int8").tobytes()
+        peak = max(map(abs, embedding), default=0.0) or 1.0
+        return _vector_struct("b", len(embedding)).pack(*(round(x * 127 / peak) for x in embedding))
+    if hasattr(embedding, "tobytes"):
+        return embedding.astype("float32", copy=False).tobytes()
+    return _vector_struct("f", len(embedding)).pack(*embedding)
 
 
 def deserialize_embedding(data: bytes, dim: int) -> list[float]:
-    return list(struct.unpack(f"{dim}f", data))
+    return list(_vector_struct("f", dim).unpack(data))
 
 
 __all__ = [
     "get_dimension",
     "get_embeddings",
     "get_embeddings_sync",
+    "iter_embeddings_sync",
     "serialize_embedding",
     "deserialize_embedding",
 ]
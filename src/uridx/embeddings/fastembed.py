@@ -1,3 +1,4 @@
+from collections.abc import Iterator, Sequence
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
@@ -33,10 +34,16 @@ def get_dimension(model: str) -> int:
     return len(embeddings[0])
 
 
-def get_embeddings_sync(texts: list[str], model: str) -> list[list[float]]:
+def get_embeddings_sync(texts: list[str], model: str) -> list[Sequence[float]]:
+    # numpy arrays, kept as-is: serialize_embedding writes their float32 buffer directly.
     embedding_model = _get_model(model)
-    return [embedding.tolist() for embedding in embedding_model.embed(texts)]
+    return list(embedding_model.embed(texts))
 
 
-async def get_embeddings(texts: list[str], model: str) -> list[list[float]]:
+def iter_embeddings_sync(texts: list[str], model: str) -> Iterator[list[Sequence[float]]]:
+    # fastembed runs in-process; there is no request latency to overlap, so one batch.
+    yield get_embeddings_sync(texts, model)
+
+
+async def get_embeddings(texts: list[str], model: str) -> list[Sequence[float]]:
     return get_embeddings_sync(texts, model)
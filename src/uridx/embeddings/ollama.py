@@ -1,8 +1,27 @@
+import asyncio
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+
 import httpx
 
-from uridx.config import normalize_ollama_url
+from uridx.config import OLLAMA_EMBED_BATCH_SIZE, normalize_ollama_url
 
 DEFAULT_TIMEOUT = 60.0
+# Sub-batches of one call that may be in flight against Ollama at once.
+MAX_CONCURRENT_BATCHES = 4
+
+_client: httpx.Client | None = None
+
+
+def _get_client() -> httpx.Client:
+    """Process-wide client, so connections to Ollama stay alive between embedding calls."""
+    global _client
+    if _client is None:
+        _client = httpx.Client(
+            timeout=httpx.Timeout(DEFAULT_TIMEOUT, connect=10.0),
+            limits=httpx.Limits(max_keepalive_connections=MAX_CONCURRENT_BATCHES, keepalive_expiry=60.0),
+        )
+    return _client
 
 
 def _url(base_url: str, path: str) -> str:
@@ -11,38 +30,110 @@ def _url(base_url: str, path: str) -> str:
 
 
 def get_dimension(model: str, base_url: str) -> int:
-    with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-        response = client.post(
-            _url(base_url, "/api/show"),
-            json={"name": model},
-        )
-        response.raise_for_status()
-        data = response.json()
+    response = _get_client().post(
+        _url(base_url, "/api/show"),
+        json={"name": model},
+    )
+    response.raise_for_status()
+    data = response.json()
 
-        model_info = data.get("model_info", {})
-        for key, value in model_info.items():
-            if "embedding_length" in key.lower():
-                return value
+    model_info = data.get("model_info", {})
+    for key, value in model_info.items():
+        if "embedding_length" in key.lower():
+            return value
 
     test_embedding = get_embeddings_sync(["test"], model, base_url)[0]
     return len(test_embedding)
 
 
-def get_embeddings_sync(texts: list[str], model: str, base_url: str) -> list[list[float]]:
-    with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
-        response = client.post(
-            _url(base_url, "/api/embed"),
-            json={"model": model, "input": texts},
-        )
+def _batches(texts: list[str]) -> list[list[str]]:
+    size = max(1, OLLAMA_EMBED_BATCH_SIZE)
+    return [texts[i : i + size] for i in range(0, len(texts), size)]
+
+
+def _route_missing(response: httpx.Response) -> bool:
+    """A 404 for an unknown route (plain-text body), not Ollama's JSON error (e.g. model not pulled)."""
+    if response.status_code != 404:
+        return False
+    try:
+        return "error" not in response.json()
+    except ValueError:
+        return True
+
+
+def _batch_embeddings(response: httpx.Response) -> list[list[float]] | None:
+    """Embeddings from an /api/embed response, or None if the server predates that endpoint."""
+    if _route_missing(response):
+        return None
+    response.raise_for_status()
+    return response.json().get("embeddings")
+
+
+def _embed_batch(client: httpx.Client, texts: list[str], model: str, base_url: str) -> list[list[float]]:
+    response = client.post(
+        _url(base_url, "/api/embed"),
+        json={"model": model, "input": texts},
+    )
+    embeddings = _batch_embeddings(response)
+    if embeddings is not None:
+        return embeddings
+
+    # Older Ollama: legacy /api/embeddings takes one prompt per request.
+    embeddings = []
+    for text in texts:
+        response = client.post(_url(base_url, "/api/embeddings"), json={"model": model, "prompt": text})
+        response.raise_for_status()
+        embeddings.append(response.json()["embedding"])
+    return embeddings
+
+
+async def _embed_batch_async(
+    client: httpx.AsyncClient, texts: list[str], model: str, base_url: str
+) -> list[list[float]]:
+    response = await client.post(
+        _url(base_url, "/api/embed"),
+        json={"model": model, "input": texts},
+    )
+    embeddings = _batch_embeddings(response)
+    if embeddings is not None:
+        return embeddings
+
+    # Older Ollama: legacy /api/embeddings takes one prompt per request.
+    embeddings = []
+    for text in texts:
+        response = await client.post(_url(base_url, "/api/embeddings"), json={"model": model, "prompt": text})
         response.raise_for_status()
-        return response.json()["embeddings"]
+        embeddings.append(response.json()["embedding"])
+    return embeddings
+
+
+def iter_embeddings_sync(texts: list[str], model: str, base_url: str) -> Iterator[list[list[float]]]:
+    """Embed texts in OLLAMA_EMBED_BATCH_SIZE sub-batches, a few in flight at once.
+
+    Yields each sub-batch's embeddings in input order as soon as it is ready, so the caller
+    can store one while later ones are still being computed.
+    """
+    client = _get_client()
+    batches = _batches(texts)
+    if len(batches) <= 1:
+        yield _embed_batch(client, texts, model, base_url)
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_BATCHES, len(batches))) as pool:
+        yield from pool.map(lambda batch: _embed_batch(client, batch, model, base_url), batches)
+
+
+def get_embeddings_sync(texts: list[str], model: str, base_url: str) -> list[list[float]]:
+    return [emb for batch in iter_embeddings_sync(texts, model, base_url) for emb in batch]
 
 
 async def get_embeddings(texts: list[str], model: str, base_url: str) -> list[list[float]]:
+    """Async get_embeddings_sync: sub-batches gathered under a semaphore."""
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_BATCHES)
     async with httpx.AsyncClient(timeout=DEFAULT_TIMEOUT) as client:
-        response = await client.post(
-            _url(base_url, "/api/embed"),
-            json={"model": model, "input": texts},
-        )
-        response.raise_for_status()
-        return response.json()["embeddings"]
+
+        async def embed(batch: list[str]) -> list[list[float]]:
+            async with semaphore:
+                return await _embed_batch_async(client, batch, model, base_url)
+
+        results = await asyncio.gather(*(embed(batch) for batch in _batches(texts)))
+        return [emb for batch_embeddings in results for emb in batch_embeddings]
@@ -18,7 +18,8 @@ class Record(BaseModel):
     chunks: list[ChunkInput] = Field(default_factory=list)
     title: str | None = None
     source_type: str | None = None
-    context: str | None = None
+    # A JSON object is kept as-is in the JSONL and serialized once at ingest; strings are stored verbatim.
+    context: str | dict | None = None
     tags: list[str] = Field(default_factory=list)
     created_at: str | None = None
     machine: str | None = None
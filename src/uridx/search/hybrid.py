@@ -4,7 +4,7 @@ from datetime import datetime, timezone
 from sqlmodel import select
 
 from uridx.config import URIDX_MIN_SCORE
-from uridx.db.engine import get_raw_connection, get_session
+from uridx.db.engine import VEC_PARAMS, get_embedding_dtype, get_raw_connection, get_session
 from uridx.db.models import Chunk, Item, Tag
 from uridx.embeddings import get_embeddings_sync, serialize_embedding
 from uridx.search.query import process_query
@@ -69,10 +69,12 @@ def hybrid_search(
 
     if semantic:
         query_embedding = get_embeddings_sync([query])[0]
-        embedding_blob = serialize_embedding(query_embedding)
+        dtype = get_embedding_dtype()
+        embedding_blob = serialize_embedding(query_embedding, dtype)
 
         cursor.execute(
-            "SELECT chunk_id, distance FROM chunk_embeddings WHERE embedding MATCH ? ORDER BY distance LIMIT ?",
+            f"SELECT chunk_id, distance FROM chunk_embeddings WHERE embedding MATCH {VEC_PARAMS[dtype]} "
+            "ORDER BY distance LIMIT ?",
             (embedding_blob, limit * 3),
         )
         vec_results = cursor.fetchall()